@@ -0,0 +1,37 @@
+import { NextResponse } from 'next/server';
+import { GET as getFred } from '../fred/route';
+import { GET as getFearGreed } from '../fear-greed/route';
+
+export const dynamic = 'force-dynamic';
+export const runtime = 'nodejs';
+
+// Aggregated payload for the monitoring scripts: FRED + Fear & Greed in one response
+// (query parameters such as ?latest=1 are forwarded to the FRED handler)
+export async function GET(request: Request) {
+  try {
+    const [fredResponse, fgResponse] = await Promise.all([
+      getFred(request),
+      getFearGreed()
+    ]);
+
+    if (!fredResponse.ok || !fgResponse.ok) {
+      return NextResponse.json(
+        { error: 'Failed to fetch dashboard data' },
+        { status: 502 }
+      );
+    }
+
+    const [fred, fearGreed] = await Promise.all([
+      fredResponse.json(),
+      fgResponse.json()
+    ]);
+
+    return NextResponse.json({ fred, fearGreed });
+  } catch (error) {
+    console.error('Error in dashboard API:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch dashboard data' },
+      { status: 500 }
+    );
+  }
+}
@@ -33,8 +33,20 @@ interface DataPoint {
   value: number | null;
 }
 
-async function fetchFredData(seriesId: string) {
-  const url = `${FRED_BASE_URL}?series_id=${seriesId}&api_key=${FRED_API_KEY}&file_type=json&sort_order=desc&limit=10000`;
+// Keep only the most recent observation of each series (for ?latest=1 callers)
+function latestOnly(payload: Record<string, unknown>) {
+  const result: Record<string, unknown> = { ...payload };
+  for (const key of ['t10y2y', 'unrate', 'hyOas', 'ismPmi']) {
+    const series = payload[key];
+    if (Array.isArray(series)) {
+      result[key] = series.slice(-1);
+    }
+  }
+  return result;
+}
+
+async function fetchFredData(seriesId: string, limit = 10000) {
+  const url = `${FRED_BASE_URL}?series_id=${seriesId}&api_key=${FRED_API_KEY}&file_type=json&sort_order=desc&limit=${limit}`;
 
   const response = await fetch(url);
   const data = await response.json();
@@ -85,26 +97,31 @@ async function fetchIsmPmiData() {
   }
 }
 
-export async function GET() {
+export async function GET(request?: Request) {
+  // ?latest=1: monitoring scripts only need the newest value per series
+  const latest = request ? new URL(request.url).searchParams.has('latest') : false;
+  const shape = (payload: Record<string, unknown>) => (latest ? latestOnly(payload) : payload);
+  const limit = latest ? 1 : 10000;
+
   try {
     // Try to fetch fresh data
     if (FRED_API_KEY) {
       try {
         const [t10y2y, unrate, hyOas, ismPmi] = await Promise.all([
-          fetchFredData('T10Y2Y'),
-          fetchFredData('UNRATE'),
-          fetchFredData('BAMLH0A0HYM2'),
+          fetchFredData('T10Y2Y', limit),
+          fetchFredData('UNRATE', limit),
+          fetchFredData('BAMLH0A0HYM2', limit),
           fetchIsmPmiData()
         ]);
 
-        return NextResponse.json({
+        return NextResponse.json(shape({
           t10y2y: t10y2y.reverse(),
           unrate: unrate.reverse(),
           hyOas: hyOas.reverse(),
           ismPmi: ismPmi,
           lastUpdated: new Date().toISOString(),
           source: 'live'
-        });
+        }));
       } catch (apiError) {
         console.error('API fetch failed, trying backup:', apiError);
       }
@@ -114,11 +131,11 @@ export async function GET() {
     const backupData = loadBackupData();
     if (backupData) {
       console.log('Using backup data');
-      return NextResponse.json({
+      return NextResponse.json(shape({
         ...backupData,
         source: 'backup',
         backupDate: backupData.lastUpdated
-      });
+      }));
     }
 
     // No backup available
@@ -132,11 +149,11 @@ export async function GET() {
     // Last resort: try backup
     const backupData = loadBackupData();
     if (backupData) {
-      return NextResponse.json({
+      return NextResponse.json(shape({
         ...backupData,
         source: 'backup',
         backupDate: backupData.lastUpdated
-      });
+      }));
     }
 
     return NextResponse.json(
@@ -1,3 +1,6 @@
 /** @type {import('next').NextConfig} */
-const nextConfig = {};
+const nextConfig = {
+  // gzip API responses (the monitoring scripts send Accept-Encoding: gzip, deflate)
+  compress: true
+};
 module.exports = nextConfig;
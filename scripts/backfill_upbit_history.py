@@ -10,13 +10,20 @@ Usage:
 
 import os
 import sys
-import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import math
 import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from collections import defaultdict
+
+from cache import CACHE
+from jsonio import parse_json, load_json, dump_json
 
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -25,18 +32,73 @@ DATA_FILE = PROJECT_ROOT / "data" / "upbit_volume_history.json"
 # KST 타임존 (UTC+9)
 KST = timezone(timedelta(hours=9))
 
+# 429/5xx 응답은 지수 백오프(+Retry-After)로 재시도
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True
+)
+
+# 모든 Upbit 요청이 공유하는 세션 (keep-alive로 TCP/TLS 연결 재사용)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=RETRY))
+# 압축 응답 명시 요청 (requests가 자동으로 해제)
+SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+
+# Upbit 시세 API 제한: 초당 10회
+MAX_WORKERS = 10
+RATE_LIMIT = 10
+RATE_PERIOD = 1.0
+
+# /v1/ticker 한 번에 조회할 마켓 수
+TICKER_BATCH_SIZE = 100
+
+
+class RateLimiter:
+    """최근 period초 동안의 요청 시작 시각을 기록하는 슬라이딩 윈도우 제한기
+
+    rate개의 여유가 있으면 바로 통과하고, 예산이 소진된 경우에만
+    가장 오래된 요청이 윈도우를 벗어날 때까지 대기합니다. (스레드 안전)
+    """
+
+    def __init__(self, rate, period):
+        self.period = period
+        self.request_times = deque(maxlen=rate)
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            if len(self.request_times) == self.request_times.maxlen:
+                wait = self.request_times[0] + self.period - now
+                if wait > 0:
+                    # 락을 잡은 채로 대기해야 다른 스레드가 같은 슬롯을 쓰지 않음
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self.request_times.append(now)
+
+
+RATE_LIMITER = RateLimiter(RATE_LIMIT, RATE_PERIOD)
+
+
+def throttle():
+    """Upbit 요청 예산(초당 RATE_LIMIT회)이 남을 때까지 대기"""
+    RATE_LIMITER.acquire()
+
 
 def get_kst_date(date_obj):
     """datetime 객체를 KST 날짜 문자열로 변환"""
     return date_obj.astimezone(KST).strftime("%Y-%m-%d")
 
 
+@CACHE.memoize('upbit_markets', ttl=24 * 60 * 60)
 def get_krw_markets():
     """전체 KRW 마켓 리스트 조회"""
     print("📊 KRW 마켓 리스트 조회 중...")
-    response = requests.get('https://api.upbit.com/v1/market/all', timeout=10)
+    response = SESSION.get('https://api.upbit.com/v1/market/all', timeout=10)
     response.raise_for_status()
-    markets = response.json()
+    markets = parse_json(response.content)
     krw_markets = [m['market'] for m in markets if m['market'].startswith('KRW-')]
     print(f"✅ KRW 마켓: {len(krw_markets)}개")
     return krw_markets
@@ -52,6 +114,10 @@ def get_daily_candles(market, days=200, to_date=None):
 
     Returns:
         list: 일봉 데이터 리스트
+
+    Raises:
+        requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        ValueError: 응답이 올바른 JSON이 아닌 경우
     """
     url = "https://api.upbit.com/v1/candles/days"
     params = {
@@ -62,13 +128,56 @@ def get_daily_candles(market, days=200, to_date=None):
     if to_date:
         params["to"] = to_date
 
-    try:
-        response = requests.get(url, params=params, timeout=10)
+    throttle()
+
+    response = SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return parse_json(response.content)
+
+
+def get_today_volume(krw_markets):
+    """당일(진행 중) 일봉 거래대금 합계를 batched /v1/ticker로 조회
+
+    당일 일봉의 candle_acc_trade_price와 ticker의 acc_trade_price는 모두
+    UTC 0시 기준 누적값이므로, 마켓별 일봉 요청 대신 100개씩 묶어 조회합니다.
+
+    Returns:
+        int: 전체 KRW 마켓 당일 누적 거래대금
+
+    Raises:
+        requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        ValueError: 응답이 올바른 JSON이 아닌 경우
+    """
+    total_volume = 0
+
+    for i in range(0, len(krw_markets), TICKER_BATCH_SIZE):
+        batch = krw_markets[i:i + TICKER_BATCH_SIZE]
+        throttle()
+
+        response = SESSION.get(
+            'https://api.upbit.com/v1/ticker',
+            params={'markets': ','.join(batch)},
+            timeout=10
+        )
         response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"  ⚠️ {market} 조회 실패: {e}")
-        return []
+        tickers = parse_json(response.content)
+
+        total_volume += math.fsum(ticker.get('acc_trade_price', 0) for ticker in tickers)
+
+    return total_volume
+
+
+def accumulate_daily_volumes(daily_volumes, candles):
+    """일봉 리스트의 거래대금을 날짜별로 누적
+
+    Args:
+        daily_volumes: 날짜(YYYY-MM-DD) -> 거래대금 누적 dict
+        candles: get_daily_candles 결과
+    """
+    get_volume = daily_volumes.get
+    for candle in candles:
+        date_kst = candle['candle_date_time_kst'][:10]  # YYYY-MM-DD
+        daily_volumes[date_kst] = get_volume(date_kst, 0) + candle.get('candle_acc_trade_price', 0)
 
 
 def collect_historical_data(days=365):
@@ -82,76 +191,120 @@ def collect_historical_data(days=365):
     # 1. KRW 마켓 리스트
     krw_markets = get_krw_markets()
 
-    # 2. 날짜별 거래대금 저장용
-    daily_volumes = defaultdict(int)
+    # 2. 기존 데이터 로드 (이미 수집된 날짜는 요청하지 않음)
+    existing_data = {}
+    if DATA_FILE.exists():
+        existing_data = load_json(DATA_FILE)
+
+    # 날짜별 거래대금 저장용
+    # 일부 마켓 조회에 실패한 날짜는 합계가 불완전하므로 저장하지 않음
+    daily_volumes = {}
+    incomplete_dates = set()
 
     # 3. 수집할 기간 계산
-    # 200개씩 나눠서 조회
-    num_batches = (days + 199) // 200
+    # 당일은 ticker 배치 조회, 나머지 과거 일수는 일봉을 200개씩 나눠서 조회
+    # (일봉은 UTC 0시 = KST 09시에 시작)
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    history_days = days - 1
+    num_batches = (history_days + 199) // 200
+    num_ticker_requests = (len(krw_markets) + TICKER_BATCH_SIZE - 1) // TICKER_BATCH_SIZE
+    total_requests = num_ticker_requests + num_batches * len(krw_markets)
 
     print(f"\n📅 수집 계획:")
     print(f"  - 기간: 최근 {days}일")
     print(f"  - 배치: {num_batches}번")
     print(f"  - 마켓: {len(krw_markets)}개")
-    print(f"  - 총 요청: 약 {num_batches * len(krw_markets)}회")
-    print(f"  - 예상 시간: 약 {num_batches * len(krw_markets) * 0.12 / 60:.1f}분\n")
-
-    # 4. 배치별로 수집
+    print(f"  - 총 요청: 약 {total_requests}회")
+    print(f"  - 예상 시간: 약 {total_requests * RATE_PERIOD / RATE_LIMIT / 60:.1f}분\n")
+
+    # 4. 당일 거래대금 (batched ticker)
+    today = today_start.strftime("%Y-%m-%d")
+    if today in existing_data:
+        print(f"⏭️ 당일 ({today}) 데이터가 이미 있어 건너뜁니다\n")
+    else:
+        print(f"📦 당일 ({today}) ticker 조회")
+        try:
+            daily_volumes[today] = get_today_volume(krw_markets)
+            print(f"   ✅ 당일 조회 완료\n")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            incomplete_dates.add(today)
+            print(f"   ⚠️ 당일 ticker 조회 실패, 당일은 저장하지 않습니다: {e}\n")
+
+    # 5. 배치별로 과거 일봉 수집
     for batch_idx in range(num_batches):
-        batch_days = min(200, days - batch_idx * 200)
-
-        # 이 배치의 종료 날짜 계산
-        if batch_idx == 0:
-            to_date = None  # 가장 최근 = 현재
-        else:
-            # 이전 배치의 시작일 = 이 배치의 종료일
-            days_ago = batch_idx * 200
-            to_datetime = datetime.now(KST) - timedelta(days=days_ago)
-            to_date = to_datetime.strftime("%Y-%m-%d %H:%M:%S")
-
-        print(f"📦 배치 {batch_idx + 1}/{num_batches} (최근 {batch_days}일)")
-        if to_date:
-            print(f"   종료일: {to_date}")
-
-        # 각 마켓별로 일봉 데이터 수집
-        for market_idx, market in enumerate(krw_markets):
-            candles = get_daily_candles(market, batch_days, to_date)
-
-            # 날짜별로 거래대금 누적
-            for candle in candles:
-                date_kst = candle['candle_date_time_kst'][:10]  # YYYY-MM-DD
-                trade_price = candle.get('candle_acc_trade_price', 0)
-                daily_volumes[date_kst] += trade_price
-
-            # Rate limit 준수 (초당 10회 = 0.1초 간격)
-            time.sleep(0.12)
-
-            # 진행 상황 표시
-            if (market_idx + 1) % 50 == 0:
-                print(f"   진행: {market_idx + 1}/{len(krw_markets)} 마켓 완료")
+        batch_days = min(200, history_days - batch_idx * 200)
+
+        # 이 배치의 종료 시각 (exclusive, UTC): 첫 배치는 당일 일봉 직전
+        to_datetime = today_start - timedelta(days=batch_idx * 200)
+
+        # 이미 수집된 날짜를 제외하고, 누락된 날짜를 감싸는 구간만 요청
+        missing = [
+            i for i in range(1, batch_days + 1)
+            if (to_datetime - timedelta(days=i)).strftime("%Y-%m-%d") not in existing_data
+        ]
+        if not missing:
+            print(f"⏭️ 배치 {batch_idx + 1}/{num_batches}: 모든 날짜가 이미 있어 건너뜁니다\n")
+            continue
+
+        to_datetime -= timedelta(days=missing[0] - 1)
+        batch_days = missing[-1] - missing[0] + 1
+        to_date = to_datetime.strftime("%Y-%m-%d %H:%M:%S")
+
+        print(f"📦 배치 {batch_idx + 1}/{num_batches} (과거 {batch_days}일, 누락 {len(missing)}일)")
+        print(f"   종료일: {to_date}")
+
+        batch_dates = [
+            (to_datetime - timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(1, batch_days + 1)
+        ]
+
+        # 각 마켓별로 일봉 데이터 수집 (요청은 병렬, 간격은 throttle로 제한)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(get_daily_candles, market, batch_days, to_date): market
+                for market in krw_markets
+            }
+
+            # 완료되는 순서대로 누적 (느린 마켓이 앞선 결과 처리를 막지 않음)
+            for market_idx, future in enumerate(as_completed(futures)):
+                market = futures[future]
+                try:
+                    candles = future.result()
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    # 재시도 후에도 실패 → 이 배치 기간은 합계가 불완전
+                    print(f"  ⚠️ {market} 조회 실패, 배치 기간을 저장에서 제외합니다: {e}")
+                    incomplete_dates.update(batch_dates)
+                    continue
+
+                # 날짜별로 거래대금 누적
+                accumulate_daily_volumes(daily_volumes, candles)
+
+                # 진행 상황 표시
+                if (market_idx + 1) % 50 == 0:
+                    print(f"   진행: {market_idx + 1}/{len(krw_markets)} 마켓 완료")
 
         print(f"   ✅ 배치 {batch_idx + 1} 완료\n")
 
-    # 5. 기존 데이터 로드
-    existing_data = {}
-    if DATA_FILE.exists():
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-
-    # 6. 새 데이터와 병합 (기존 데이터 우선)
-    for date, volume in daily_volumes.items():
-        if date not in existing_data:
-            existing_data[date] = int(volume)
+    # 6. 새 데이터와 병합 (기존 데이터 우선, 불완전한 날짜 제외)
+    if incomplete_dates:
+        print(f"⚠️ 조회 실패로 {len(incomplete_dates)}일은 저장하지 않습니다. 다시 실행하면 채워집니다.")
+    new_dates = [
+        date for date in daily_volumes
+        if date not in existing_data and date not in incomplete_dates
+    ]
+    for date in new_dates:
+        existing_data[date] = int(daily_volumes[date])
 
     # 7. 날짜 순 정렬
     sorted_data = dict(sorted(existing_data.items()))
 
-    # 8. 저장
-    DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(sorted_data, f, indent=2, ensure_ascii=False)
-
-    print(f"✅ 저장 완료: {DATA_FILE}")
+    # 8. 저장 (추가된 날짜가 없으면 파일을 다시 쓰지 않음)
+    if new_dates:
+        DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(DATA_FILE, sorted_data)
+        print(f"✅ 저장 완료: {DATA_FILE} (신규 {len(new_dates)}일)")
+    else:
+        print(f"✅ 새로 추가된 날짜가 없어 저장을 건너뜁니다: {DATA_FILE}")
     print(f"📊 총 레코드: {len(sorted_data)}개")
     print(f"📅 기간: {min(sorted_data.keys())} ~ {max(sorted_data.keys())}")
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+API 응답 파일 캐시
+
+느리게 변하는 응답(KRW 마켓 리스트, FRED, Fear & Greed)을
+.cache/{namespace}/{md5(key)}.json 에 {"ts": ..., "data": ...} 형태로 저장하고
+TTL 이내의 재실행에서는 네트워크 요청을 건너뜁니다.
+HTTP 응답은 ETag/Last-Modified도 함께 저장해 만료 후 조건부 요청(304)에 사용합니다.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from pathlib import Path
+
+from jsonio import parse_json, dumps_json, load_json, dump_json
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / ".cache"
+
+
+class FileCache:
+    """namespace별 디렉토리에 JSON 응답을 저장하는 TTL 캐시"""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, namespace, key):
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return self.root / namespace / f"{digest}.json"
+
+    def _read(self, namespace, key):
+        try:
+            return load_json(self._path(namespace, key))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, namespace, key, entry):
+        path = self._path(namespace, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(path, entry, indent=False)
+        except OSError as e:
+            print(f"⚠️ 캐시 저장 실패 ({namespace}): {e}")
+
+    @staticmethod
+    def _is_fresh(entry, ttl):
+        return ttl is None or time.time() - entry['ts'] <= ttl
+
+    def get(self, namespace, key, ttl):
+        """TTL(초) 이내의 캐시 데이터 반환, 없거나 만료되면 None"""
+        entry = self._read(namespace, key)
+        if entry is None or not self._is_fresh(entry, ttl):
+            return None
+        return entry['data']
+
+    def set(self, namespace, key, data):
+        """데이터를 현재 시각과 함께 저장 (실패해도 무시)"""
+        self._write(namespace, key, {'ts': time.time(), 'data': data})
+
+    def fetch_json(self, session, url, namespace, ttl, timeout=30):
+        """URL의 JSON 응답을 캐시와 함께 조회
+
+        TTL 이내면 네트워크 없이 반환하고, 만료되었으면 저장된 ETag/Last-Modified로
+        조건부 GET을 보내 304 응답 시 기존 본문을 재사용합니다.
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패 또는 오류 상태 코드
+        """
+        entry = self._read(namespace, url)
+        if entry is not None and self._is_fresh(entry, ttl):
+            return entry['data']
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            entry['ts'] = time.time()
+            self._write(namespace, url, entry)
+            return entry['data']
+
+        response.raise_for_status()
+        data = parse_json(response.content)
+        self._write(namespace, url, {
+            'ts': time.time(),
+            'data': data,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        })
+        return data
+
+    def memoize(self, namespace, ttl):
+        """함수 인자를 키로 반환값을 캐시하는 데코레이터 (None은 캐시하지 않음)
+
+        Args:
+            namespace: 캐시 하위 디렉토리 이름
+            ttl: 유효 시간(초), None이면 만료 없음
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = dumps_json([args, kwargs]).decode('utf-8')
+                data = self.get(namespace, key, ttl)
+                if data is not None:
+                    return data
+
+                data = func(*args, **kwargs)
+                if data is not None:
+                    self.set(namespace, key, data)
+                return data
+            return wrapper
+        return decorator
+
+
+# 스크립트 간 공유 인스턴스
+CACHE = FileCache()
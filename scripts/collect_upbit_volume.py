@@ -11,21 +11,40 @@ Usage:
 
 import os
 import sys
-import json
+import math
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from jsonio import parse_json, load_json, dump_json
+
 # 프로젝트 루트 디렉토리
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_FILE = PROJECT_ROOT / "data" / "upbit_volume_history.json"
 
+# KST 타임존 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+# 429/5xx 응답은 지수 백오프(+Retry-After)로 재시도
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True
+)
+
+# 모든 Upbit 요청이 공유하는 세션 (keep-alive로 TCP/TLS 연결 재사용)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=RETRY))
+# 압축 응답 명시 요청 (requests가 자동으로 해제)
+SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+
 
 def get_kst_date():
     """현재 KST 날짜 반환 (YYYY-MM-DD 형식)"""
-    kst = timezone(timedelta(hours=9))
-    now_kst = datetime.now(kst)
-    return now_kst.strftime("%Y-%m-%d")
+    return datetime.now(KST).strftime("%Y-%m-%d")
 
 
 def get_upbit_total_volume():
@@ -34,12 +53,12 @@ def get_upbit_total_volume():
     try:
         # 1. 전체 마켓 리스트 조회
         print("📊 마켓 리스트 조회 중...")
-        markets_response = requests.get(
+        markets_response = SESSION.get(
             'https://api.upbit.com/v1/market/all',
             timeout=10
         )
         markets_response.raise_for_status()
-        markets = markets_response.json()
+        markets = parse_json(markets_response.content)
 
         # KRW 마켓만 필터링
         krw_markets = [m['market'] for m in markets if m['market'].startswith('KRW-')]
@@ -47,27 +66,26 @@ def get_upbit_total_volume():
 
         # 2. 전체 ticker 정보 조회 (100개씩 배치)
         print("💰 거래대금 조회 중...")
-        all_tickers = []
+        trade_prices = []
         batch_size = 100
 
         for i in range(0, len(krw_markets), batch_size):
             batch = krw_markets[i:i+batch_size]
             params = {'markets': ','.join(batch)}
 
-            response = requests.get(
+            response = SESSION.get(
                 'https://api.upbit.com/v1/ticker',
                 params=params,
                 timeout=10
             )
             response.raise_for_status()
-            tickers = response.json()
-            all_tickers.extend(tickers)
+            tickers = parse_json(response.content)
 
-        # 3. 거래대금 합산
-        total_volume = sum(
-            ticker.get('acc_trade_price_24h', 0)
-            for ticker in all_tickers
-        )
+            # ticker 전체가 아닌 24시간 거래대금 필드만 보관
+            trade_prices.extend(ticker.get('acc_trade_price_24h', 0) for ticker in tickers)
+
+        # 3. 거래대금 합산 (C 구현, 부동소수점 누적 오차 없음)
+        total_volume = math.fsum(trade_prices)
 
         print(f"💵 전체 거래대금: {total_volume:,.0f}원 ({total_volume/1_000_000_000_000:.2f}조원)")
 
@@ -91,10 +109,9 @@ def load_history():
         return {}
 
     try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            print(f"📁 기존 데이터: {len(data)}개 레코드")
-            return data
+        data = load_json(DATA_FILE)
+        print(f"📁 기존 데이터: {len(data)}개 레코드")
+        return data
     except Exception as e:
         print(f"⚠️ 히스토리 로드 실패: {e}", file=sys.stderr)
         return {}
@@ -110,8 +127,7 @@ def save_history(history):
         # 날짜 순으로 정렬
         sorted_history = dict(sorted(history.items()))
 
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(sorted_history, f, indent=2, ensure_ascii=False)
+        dump_json(DATA_FILE, sorted_history)
 
         print(f"✅ 저장 완료: {DATA_FILE}")
         print(f"📊 총 레코드: {len(sorted_history)}개")
@@ -142,6 +158,10 @@ def main():
     # 3. 오늘 날짜로 데이터 추가/업데이트
     today = get_kst_date()
 
+    if history.get(today) == total_volume:
+        print(f"✅ {today} 데이터가 이미 최신입니다. 저장을 건너뜁니다.")
+        sys.exit(0)
+
     if today in history:
         print(f"⚠️ {today} 데이터가 이미 존재합니다. 업데이트합니다.")
 
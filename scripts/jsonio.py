@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+JSON 파일 읽기/쓰기 헬퍼
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작합니다.
+두 경로 모두 json.dump(indent=2, ensure_ascii=False)와 동일한 출력을 만듭니다.
+"""
+
+import os
+import json
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 새 파일 권한 계산용 umask (os.umask는 조회만 할 수 없어 import 시 한 번 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _file_mode(path):
+    """기존 파일의 권한, 없으면 open('w')와 같은 0o666 & ~umask"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def parse_json(content):
+    """bytes/str JSON 파싱 (HTTP 응답 본문 등)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(data):
+    """키 정렬된 compact JSON bytes (해시/캐시 키용, orjson과 json 출력 동일)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def load_json(path):
+    """JSON 파일 로드"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(path, data, indent=True):
+    """JSON 파일 저장 (UTF-8, indent=False면 공백 없는 compact 형식)
+
+    같은 디렉토리의 고유한 임시 파일에 한 번에 쓰고 fsync한 뒤 os.replace로 교체하므로
+    중간에 실패하거나 동시에 실행되어도, 전원이 나가도 기존 파일이 깨지지 않습니다.
+    (동시에 저장하면 마지막으로 교체한 쪽의 내용이 남습니다)
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    elif indent:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            # mkstemp은 0600으로 만들므로 기존 파일(또는 umask 기본값)의 권한으로 맞춤
+            os.fchmod(f.fileno(), _file_mode(path))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
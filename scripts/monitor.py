@@ -5,10 +5,26 @@ Detects Fear & Greed regime changes and indicator threshold crossings
 """
 
 import os
-import json
+import time
+import hashlib
+import bisect
+import operator
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from cache import CACHE
+from jsonio import parse_json, dumps_json, load_json, dump_json
 
 # Configuration
 DASHBOARD_URL = os.getenv('DASHBOARD_URL', 'https://macro-risk-dashboard-psi.vercel.app')
@@ -16,14 +32,91 @@ TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 STATE_FILE = 'state.json'
 
-# Indicator thresholds for Tier 2 alerts
+# On-disk response cache TTLs (seconds)
+FRED_CACHE_TTL = 6 * 60 * 60
+FG_CACHE_TTL = 60 * 60
+
+# Shared HTTP session so dashboard and Telegram calls reuse connections.
+# Idempotent GETs are retried with backoff on 429/5xx (POSTs are not retried).
+RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=RETRY))
+SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+
+# Telegram sendMessage text limit (UTF-16 code units) and separator for batched alerts
+TELEGRAM_MAX_LENGTH = 4096
+ALERT_SEPARATOR = '\n\n━━━━━━\n\n'
+
+# Telegram 429 retries and per-process circuit breaker: after consecutive
+# failed sends, skip sending for a cooldown instead of hammering the API
+TELEGRAM_MAX_RETRIES = 3
+TELEGRAM_CIRCUIT_THRESHOLD = 3
+TELEGRAM_CIRCUIT_COOLDOWN = 60
+_tg_lock = threading.Lock()
+_tg_failures = 0
+_tg_circuit_until = 0.0
+
+# Indicator thresholds for Tier 2 alerts ('compare' puts the value on the danger side)
 INDICATOR_THRESHOLDS = {
-    't10y2y': {'critical': 0, 'label': '금리 역전', 'emoji': '⚠️'},
-    'hyOas': {'critical': 6.0, 'label': 'HY OAS 상승', 'emoji': '📊'},
-    'ismPmi': {'critical': 50, 'label': 'PMI 위축', 'emoji': '📉'},
-    'unrate': {'critical': 4.5, 'label': '실업률 상승', 'emoji': '📈'}
+    't10y2y': {'critical': 0, 'compare': operator.le, 'label': '금리 역전', 'emoji': '⚠️'},
+    'hyOas': {'critical': 6.0, 'compare': operator.ge, 'label': 'HY OAS 상승', 'emoji': '📊'},
+    'ismPmi': {'critical': 50, 'compare': operator.lt, 'label': 'PMI 위축', 'emoji': '📉'},
+    'unrate': {'critical': 4.5, 'compare': operator.ge, 'label': '실업률 상승', 'emoji': '📈'}
+}
+
+# Composite risk score weights (mirrors lib/risk-score.ts)
+RISK_WEIGHTS = {
+    't10y2y': 0.35,
+    'hyOas': 0.30,
+    'ismPmi': 0.20,
+    'unrate': 0.15
+}
+
+# Linear score breakpoints per indicator: (value scoring 0, value scoring 1),
+# clipped to 0..1 outside that range. Shared by the scalar and NumPy scorers.
+RISK_SCALES = {
+    't10y2y': (0.0, -1.0),
+    'hyOas': (4.0, 8.0),
+    'ismPmi': (50.0, 43.0),
+    'unrate': (4.0, 7.0)
 }
 
+# Risk regimes: lower score bound, display label and emoji
+REGIME_THRESHOLDS = {
+    'riskOn': {'min': 0.0, 'label': 'Risk-On', 'emoji': '🟢'},
+    'neutral': {'min': 0.35, 'label': 'Neutral', 'emoji': '🟡'},
+    'riskOff': {'min': 0.55, 'label': 'Risk-Off', 'emoji': '🟠'},
+    'crisis': {'min': 0.75, 'label': 'Crisis', 'emoji': '🔴'}
+}
+
+# Sorted regime keys and their lower bounds (excluding the first) for bisect lookup
+REGIME_KEYS = tuple(REGIME_THRESHOLDS)
+REGIME_BOUNDS = tuple(info['min'] for info in REGIME_THRESHOLDS.values())[1:]
+
+# Recommended actions per regime, pre-joined into message-ready blocks
+REGIME_ACTIONS = {regime: '\n'.join(actions) for regime, actions in {
+    'riskOn': [
+        '✅ 정상 투자 전략 유지',
+        '✅ DCA 지속 가능',
+        '✅ 성장주 비중 유지'
+    ],
+    'neutral': [
+        '⚠️ DCA 중단 고려',
+        '⚠️ 현금 비중 점검',
+        '⚠️ 방어주 편입 검토'
+    ],
+    'riskOff': [
+        '🔴 현금 비중 30% 이상 상향',
+        '🔴 방어 자산 20% 편입 고려',
+        '🔴 레버리지 포지션 축소'
+    ],
+    'crisis': [
+        '🚨 풀헤지 진입 검토',
+        '🚨 현금 비중 50% 이상',
+        '🚨 신규 진입 중단'
+    ]
+}.items()}
+
 # Fear & Greed label to emoji mapping (using original API labels)
 FG_LABEL_EMOJI = {
     'extreme fear': '🔴',
@@ -33,7 +126,37 @@ FG_LABEL_EMOJI = {
     'extreme greed': '🟢🟢'
 }
 
+# Regime change message parts: change type -> (icon, name, source)
+FG_REGIME_SOURCES = {
+    'crypto_fg': ('🪙', 'Crypto', 'Alternative.me'),
+    'stock_fg': ('📈', 'Stock', 'CNN')
+}
+
+REGIME_CHANGE_TEMPLATE = """{icon} <b>{name} Fear & Greed 변경</b>
+
+{transition}
 
+현재 값: {value}
+변경 시각: {now}
+
+Source: {source}"""
+
+MULTI_REGIME_CHANGE_HEADER = """🚨 <b>복합 F&G 변경</b>
+
+변경 시각: {now}
+
+"""
+
+MULTI_REGIME_CHANGE_ITEM = """<b>{icon} {name} F&G</b>
+{transition}
+값: {value}
+(Source: {source})
+
+"""
+
+
+
+@lru_cache(maxsize=16)
 def normalize_fg_label(label: str) -> str:
     """Normalize Fear & Greed label (title case for display)"""
     if not label:
@@ -48,6 +171,7 @@ def normalize_fg_label(label: str) -> str:
         return label.title()
 
 
+@lru_cache(maxsize=16)
 def get_fg_emoji(label: str) -> str:
     """Get emoji for Fear & Greed label from original API (case-insensitive)"""
     if not label:
@@ -55,30 +179,60 @@ def get_fg_emoji(label: str) -> str:
     return FG_LABEL_EMOJI.get(label.lower(), '❓')
 
 
+# (mtime_ns, state) of the last state.json read or written by this process
+_state_cache = None
+
+
 def load_state() -> Dict[str, Any]:
-    """Load previous state from file"""
-    if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    """Load previous state from file (re-parsed only when its mtime changes)"""
+    global _state_cache
+    try:
+        mtime = os.stat(STATE_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _state_cache is None or _state_cache[0] != mtime:
+        _state_cache = (mtime, load_json(STATE_FILE))
+    return _state_cache[1]
 
 
 def save_state(state: Dict[str, Any]):
-    """Save current state to file"""
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2)
+    """Save current state to file (compact JSON, atomic replace)"""
+    global _state_cache
+    dump_json(STATE_FILE, state, indent=False)
+    _state_cache = (os.stat(STATE_FILE).st_mtime_ns, state)
 
 
-def fetch_dashboard_data() -> Optional[Dict[str, Any]]:
-    """Fetch data from dashboard API"""
-    try:
-        # Fetch FRED data
-        fred_response = requests.get(f'{DASHBOARD_URL}/api/fred', timeout=30)
-        fred_data = fred_response.json()
+def fetch_fred_data(url: str) -> Dict[str, Any]:
+    """Fetch FRED series (cached on disk, series update daily)"""
+    return CACHE.fetch_json(SESSION, url, 'fred', FRED_CACHE_TTL)
+
+
+def fetch_fear_greed_data(url: str, ttl: int = FG_CACHE_TTL) -> Dict[str, Any]:
+    """Fetch Fear & Greed indices (cached on disk for ttl seconds)"""
+    return CACHE.fetch_json(SESSION, url, 'fear_greed', ttl)
 
-        # Fetch Fear & Greed data
-        fg_response = requests.get(f'{DASHBOARD_URL}/api/fear-greed', timeout=30)
-        fg_data = fg_response.json()
+
+def fetch_dashboard_aggregate(url: str, ttl: int = FG_CACHE_TTL) -> Dict[str, Any]:
+    """Fetch FRED + Fear & Greed in one request from /api/dashboard (cached on disk for ttl seconds)"""
+    return CACHE.fetch_json(SESSION, url, 'dashboard', ttl)
+
+
+def fetch_dashboard_data(fg_ttl: int = FG_CACHE_TTL) -> Optional[Dict[str, Any]]:
+    """Fetch data from dashboard API (fg_ttl: cache TTL for the Fear & Greed / aggregate responses)"""
+    try:
+        try:
+            aggregate = fetch_dashboard_aggregate(f'{DASHBOARD_URL}/api/dashboard?latest=1', fg_ttl)
+            fred_data = aggregate['fred']
+            fg_data = aggregate['fearGreed']
+        except Exception as e:
+            # Deployments without /api/dashboard: fetch both endpoints concurrently
+            print(f"Aggregate endpoint unavailable ({e}), fetching endpoints separately")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fred_future = executor.submit(fetch_fred_data, f'{DASHBOARD_URL}/api/fred?latest=1')
+                fg_future = executor.submit(fetch_fear_greed_data, f'{DASHBOARD_URL}/api/fear-greed', fg_ttl)
+                fred_data = fred_future.result()
+                fg_data = fg_future.result()
 
         return {
             'fred': fred_data,
@@ -90,12 +244,51 @@ def fetch_dashboard_data() -> Optional[Dict[str, Any]]:
         return None
 
 
+def telegram_length(text: str) -> int:
+    """Length as Telegram counts it (UTF-16 code units, emoji count as 2)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def batch_alerts(alerts: list) -> list:
+    """Join alerts into as few Telegram messages as fit the length limit"""
+    separator_length = telegram_length(ALERT_SEPARATOR)
+    messages = []
+    lengths = []
+    for alert in alerts:
+        alert_length = telegram_length(alert)
+        if messages and lengths[-1] + separator_length + alert_length <= TELEGRAM_MAX_LENGTH:
+            messages[-1] += ALERT_SEPARATOR + alert
+            lengths[-1] += separator_length + alert_length
+        else:
+            messages.append(alert)
+            lengths.append(alert_length)
+    return messages
+
+
+def _record_telegram_result(ok: bool):
+    """Track consecutive send failures and open the circuit after too many"""
+    global _tg_failures, _tg_circuit_until
+    with _tg_lock:
+        if ok:
+            _tg_failures = 0
+            return
+        _tg_failures += 1
+        if _tg_failures >= TELEGRAM_CIRCUIT_THRESHOLD:
+            _tg_circuit_until = time.time() + TELEGRAM_CIRCUIT_COOLDOWN
+            _tg_failures = 0
+            print(f"Telegram circuit open for {TELEGRAM_CIRCUIT_COOLDOWN}s after repeated failures")
+
+
 def send_telegram_message(message: str):
-    """Send message via Telegram"""
+    """Send message via Telegram, honouring 429 retry_after and the circuit breaker"""
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         print("Telegram credentials not configured")
         return
 
+    if time.time() < _tg_circuit_until:
+        print("Telegram circuit open, skipping message")
+        return
+
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     data = {
         "chat_id": TELEGRAM_CHAT_ID,
@@ -103,150 +296,231 @@ def send_telegram_message(message: str):
         "parse_mode": "HTML"
     }
 
-    try:
-        response = requests.post(url, json=data, timeout=10)
-        response.raise_for_status()
-        print("Telegram message sent successfully")
-    except Exception as e:
-        print(f"Error sending Telegram message: {e}")
+    for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+        try:
+            response = SESSION.post(url, json=data, timeout=10)
+            if response.status_code == 429 and attempt < TELEGRAM_MAX_RETRIES:
+                try:
+                    retry_after = parse_json(response.content).get('parameters', {}).get('retry_after', 1)
+                except ValueError:
+                    retry_after = 1
+                print(f"Telegram rate limited, retrying in {retry_after}s")
+                time.sleep(retry_after)
+                continue
+            response.raise_for_status()
+            _record_telegram_result(True)
+            print("Telegram message sent successfully")
+        except Exception as e:
+            _record_telegram_result(False)
+            print(f"Error sending Telegram message: {e}")
+        return
+
+
+def render_fg_transition(prev_label: str, curr_label: str) -> str:
+    """Render 'prev → curr' line for a regime change"""
+    return (f"{get_fg_emoji(prev_label)} {normalize_fg_label(prev_label)} → "
+            f"{get_fg_emoji(curr_label)} {normalize_fg_label(curr_label)}")
+
+
+# All transitions between known Fear & Greed labels, rendered once at import
+FG_TRANSITIONS = {
+    (prev, curr): render_fg_transition(prev, curr)
+    for prev in FG_LABEL_EMOJI
+    for curr in FG_LABEL_EMOJI
+    if prev != curr
+}
+
+
+def compute_input_hash(indicators: Dict[str, Any], crypto_label: Optional[str],
+                       stock_label: Optional[str]) -> str:
+    """Hash the inputs alert checks depend on (indicator values, case-folded F&G labels)"""
+    payload = dumps_json({
+        'indicators': indicators,
+        'crypto_fg_label': crypto_label.lower() if crypto_label else None,
+        'stock_fg_label': stock_label.lower() if stock_label else None
+    })
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def check_regime_changes(fg_data: Dict, prev_state: Dict) -> Optional[str]:
     """Check for Fear & Greed regime changes"""
     changes = []
 
-    # Check Crypto Fear & Greed regime change (using original API label)
-    crypto_fg = fg_data.get('crypto')
-    if crypto_fg:
-        current_crypto_label = crypto_fg['label']
-        prev_crypto_label = prev_state.get('crypto_fg_label')
-
-        # Compare labels (case-insensitive)
-        if prev_crypto_label and current_crypto_label.lower() != prev_crypto_label.lower():
-            changes.append({
-                'type': 'crypto_fg',
-                'prev': {'label': normalize_fg_label(prev_crypto_label), 'emoji': get_fg_emoji(prev_crypto_label)},
-                'curr': {'label': normalize_fg_label(current_crypto_label), 'emoji': get_fg_emoji(current_crypto_label)},
-                'value': crypto_fg['value']
-            })
+    # Check Crypto/Stock Fear & Greed regime change (using original API label)
+    for market, change_type in (('crypto', 'crypto_fg'), ('stock', 'stock_fg')):
+        fg = fg_data.get(market)
+        if not fg:
+            continue
 
-    # Check Stock Fear & Greed regime change (using original API label)
-    stock_fg = fg_data.get('stock')
-    if stock_fg:
-        current_stock_label = stock_fg['label']
-        prev_stock_label = prev_state.get('stock_fg_label')
+        current_label = fg['label']
+        prev_label = prev_state.get(f'{market}_fg_label')
 
         # Compare labels (case-insensitive)
-        if prev_stock_label and current_stock_label.lower() != prev_stock_label.lower():
+        if prev_label and current_label.lower() != prev_label.lower():
+            transition = (FG_TRANSITIONS.get((prev_label.lower(), current_label.lower()))
+                          or render_fg_transition(prev_label, current_label))
             changes.append({
-                'type': 'stock_fg',
-                'prev': {'label': normalize_fg_label(prev_stock_label), 'emoji': get_fg_emoji(prev_stock_label)},
-                'curr': {'label': normalize_fg_label(current_stock_label), 'emoji': get_fg_emoji(current_stock_label)},
-                'value': stock_fg['value']
+                'type': change_type,
+                'transition': transition,
+                'value': fg['value']
             })
 
     # If no changes, return None
     if not changes:
         return None
 
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M')
+
     # Build combined message
     if len(changes) == 1:
         # Single regime change
         change = changes[0]
-        if change['type'] == 'crypto_fg':
-            message = f"""🪙 <b>Crypto Fear & Greed 변경</b>
+        icon, name, source = FG_REGIME_SOURCES[change['type']]
+        return REGIME_CHANGE_TEMPLATE.format(
+            icon=icon, name=name, source=source, now=now_str,
+            transition=change['transition'], value=change['value']
+        )
+
+    # Multiple regime changes - combined message
+    message = MULTI_REGIME_CHANGE_HEADER.format(now=now_str)
+    for change in changes:
+        icon, name, source = FG_REGIME_SOURCES[change['type']]
+        message += MULTI_REGIME_CHANGE_ITEM.format(
+            icon=icon, name=name, source=source,
+            transition=change['transition'], value=change['value']
+        )
 
-{change['prev']['emoji']} {change['prev']['label']} → {change['curr']['emoji']} {change['curr']['label']}
+    return message
 
-현재 값: {change['value']}
-변경 시각: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
-Source: Alternative.me"""
+def get_latest_indicators(fred_data: Dict) -> Dict[str, Any]:
+    """Extract the latest value of each tracked FRED indicator"""
+    return {key: fred_data[key][-1]['value'] for key in INDICATOR_THRESHOLDS}
 
-        else:  # stock_fg
-            message = f"""📈 <b>Stock Fear & Greed 변경</b>
 
-{change['prev']['emoji']} {change['prev']['label']} → {change['curr']['emoji']} {change['curr']['label']}
+def _scale(key: str, value):
+    """Unclipped linear score of a value (float or NumPy array) per RISK_SCALES"""
+    zero, full = RISK_SCALES[key]
+    return (value - zero) / (full - zero)
 
-현재 값: {change['value']}
-변경 시각: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
-Source: CNN"""
+def score_indicator(key: str, value: Optional[float]) -> float:
+    """0.0 ~ 1.0 score of one indicator value (0 when missing)"""
+    if value is None:
+        return 0.0
+    return min(max(_scale(key, value), 0.0), 1.0)
 
-    else:
-        # Multiple regime changes - combined message
-        message = f"""🚨 <b>복합 F&G 변경</b>
 
-변경 시각: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+def calculate_risk_score(indicators: Dict[str, Any]) -> float:
+    """Composite risk score (0.0 ~ 1.0) from latest indicator values
 
-"""
-        for change in changes:
-            if change['type'] == 'crypto_fg':
-                message += f"""<b>🪙 Crypto F&G</b>
-{change['prev']['emoji']} {change['prev']['label']} → {change['curr']['emoji']} {change['curr']['label']}
-값: {change['value']}
-(Source: Alternative.me)
+    Like calculateCompositeScore in lib/risk-score.ts, a missing (None) value
+    contributes 0 instead of invalidating the whole score.
+    """
+    score = sum(score_indicator(key, indicators[key]) * weight
+                for key, weight in RISK_WEIGHTS.items())
+    return min(max(score, 0.0), 1.0)
 
-"""
-            else:  # stock_fg
-                message += f"""<b>📈 Stock F&G</b>
-{change['prev']['emoji']} {change['prev']['label']} → {change['curr']['emoji']} {change['curr']['label']}
-값: {change['value']}
-(Source: CNN)
 
-"""
+def score_series(t10y2y: Sequence, hyOas: Sequence, ismPmi: Sequence,
+                 unrate: Sequence) -> list:
+    """Composite risk scores for aligned indicator series (backtests, regime history)
 
-    return message
+    Uses NumPy clip/weighted-sum over whole arrays when available, otherwise
+    falls back to calculate_risk_score per point. None where any value is missing
+    (as calculateHistoricalScores in lib/risk-score.ts).
+
+    Raises:
+        ValueError: series lengths differ
+    """
+    if len({len(t10y2y), len(hyOas), len(ismPmi), len(unrate)}) > 1:
+        raise ValueError("Indicator series must have the same length")
+
+    if np is None:
+        return [
+            None if None in (t, h, i, u)
+            else calculate_risk_score({'t10y2y': t, 'hyOas': h, 'ismPmi': i, 'unrate': u})
+            for t, h, i, u in zip(t10y2y, hyOas, ismPmi, unrate)
+        ]
+
+    # None -> NaN, which propagates through clip and the weighted sum
+    columns = {'t10y2y': t10y2y, 'hyOas': hyOas, 'ismPmi': ismPmi, 'unrate': unrate}
+    scores = sum(np.clip(_scale(key, np.asarray(columns[key], dtype=float)), 0.0, 1.0) * weight
+                 for key, weight in RISK_WEIGHTS.items())
+    scores = np.clip(scores, 0.0, 1.0)
+    return np.where(np.isnan(scores), None, scores).tolist()
+
+
+def get_regime_from_score(score: float) -> str:
+    """Map a risk score to its regime key"""
+    return REGIME_KEYS[bisect.bisect_right(REGIME_BOUNDS, score)]
+
+
+def indicator_breached(key: str, value: Optional[float]) -> bool:
+    """True if the indicator value is past its Tier 2 threshold (None is never breached)"""
+    threshold = INDICATOR_THRESHOLDS[key]
+    return value is not None and threshold['compare'](value, threshold['critical'])
+
+
+def crossed_threshold(key: str, value: Optional[float], prev_indicators: Dict) -> bool:
+    """True if the indicator entered its danger zone since the previous reading
+
+    A previous reading stored as None is unknown, so it never counts as a crossing
+    (an indicator with no history yet is treated as outside the danger zone).
+    """
+    if key in prev_indicators and prev_indicators[key] is None:
+        return False
+    return indicator_breached(key, value) and not indicator_breached(key, prev_indicators.get(key))
 
 
-def check_tier2_alerts(fred_data: Dict, prev_state: Dict) -> list:
+def carry_forward_indicators(current_indicators: Dict, prev_indicators: Dict) -> Dict[str, Any]:
+    """Replace missing (None) readings with the last known value from the previous state
+
+    FRED reports holidays as '.' and exact 0.00 both map to null, which would otherwise
+    overwrite the stored value and make the next real reading look like a new crossing.
+    """
+    return {key: prev_indicators.get(key) if value is None else value
+            for key, value in current_indicators.items()}
+
+
+def check_tier2_alerts(current_indicators: Dict, prev_state: Dict) -> list:
     """Check for Tier 2: Individual indicator threshold crossings"""
     alerts = []
 
     try:
-        current_indicators = {
-            't10y2y': fred_data['t10y2y'][-1]['value'],
-            'hyOas': fred_data['hyOas'][-1]['value'],
-            'ismPmi': fred_data['ismPmi'][-1]['value'],
-            'unrate': fred_data['unrate'][-1]['value']
-        }
+        t10y2y = current_indicators['t10y2y']
+        hyOas = current_indicators['hyOas']
+        ismPmi = current_indicators['ismPmi']
+        unrate = current_indicators['unrate']
 
         prev_indicators = prev_state.get('indicators', {})
 
         # Check T10Y2Y inversion
-        if current_indicators['t10y2y'] is not None:
-            if (current_indicators['t10y2y'] <= 0 and
-                prev_indicators.get('t10y2y', 1) > 0):
-                alerts.append(f"""⚠️ <b>T10Y2Y 금리 역전 발생</b>
+        if crossed_threshold('t10y2y', t10y2y, prev_indicators):
+            alerts.append(f"""⚠️ <b>T10Y2Y 금리 역전 발생</b>
 
-현재 값: {current_indicators['t10y2y']:.2f}%
+현재 값: {t10y2y:.2f}%
 역사적으로 12-18개월 내 경기침체 신호""")
 
         # Check HY OAS
-        if current_indicators['hyOas'] is not None:
-            if (current_indicators['hyOas'] >= 6.0 and
-                prev_indicators.get('hyOas', 0) < 6.0):
-                alerts.append(f"""📊 <b>HY OAS 위험 수준 진입</b>
+        if crossed_threshold('hyOas', hyOas, prev_indicators):
+            alerts.append(f"""📊 <b>HY OAS 위험 수준 진입</b>
 
-현재 값: {current_indicators['hyOas']:.2f}%
+현재 값: {hyOas:.2f}%
 신용 위험 증가 신호""")
 
         # Check ISM PMI
-        if current_indicators['ismPmi'] is not None:
-            if (current_indicators['ismPmi'] < 50 and
-                prev_indicators.get('ismPmi', 100) >= 50):
-                alerts.append(f"""📉 <b>ISM PMI 위축 진입</b>
+        if crossed_threshold('ismPmi', ismPmi, prev_indicators):
+            alerts.append(f"""📉 <b>ISM PMI 위축 진입</b>
 
-현재 값: {current_indicators['ismPmi']:.1f}
+현재 값: {ismPmi:.1f}
 제조업 위축 신호""")
 
         # Check Unemployment
-        if current_indicators['unrate'] is not None:
-            if (current_indicators['unrate'] >= 4.5 and
-                prev_indicators.get('unrate', 0) < 4.5):
-                alerts.append(f"""📈 <b>실업률 상승</b>
+        if crossed_threshold('unrate', unrate, prev_indicators):
+            alerts.append(f"""📈 <b>실업률 상승</b>
 
-현재 값: {current_indicators['unrate']:.1f}%
+현재 값: {unrate:.1f}%
 경제 둔화 가능성""")
 
         return alerts
@@ -255,62 +529,26 @@ def check_tier2_alerts(fred_data: Dict, prev_state: Dict) -> list:
         return []
 
 
-
-
-def generate_weekly_summary(data: Dict) -> str:
-    """Generate weekly summary report"""
-    try:
-        fred_data = data['fred']
-        fg_data = data['fearGreed']
-
-        # Get indicator values
-        t10y2y = fred_data['t10y2y'][-1]['value']
-        hyOas = fred_data['hyOas'][-1]['value']
-        ismPmi = fred_data['ismPmi'][-1]['value']
-        unrate = fred_data['unrate'][-1]['value']
-
-        crypto_fg = fg_data.get('crypto', {})
-        stock_fg = fg_data.get('stock', {})
-
-        message = f"""📊 <b>주간 리뷰</b>
-
-━━━━━━━━━━━━━━━━━━━━
-<b>거시경제 지표</b>
-• T10Y2Y: {t10y2y:.2f}% {'⚠️' if t10y2y <= 0 else '✅'}
-• HY OAS: {hyOas:.2f}% {'⚠️' if hyOas >= 6.0 else '✅'}
-• ISM PMI: {ismPmi:.1f} {'⚠️' if ismPmi < 50 else '✅'}
-• 실업률: {unrate:.1f}% {'⚠️' if unrate >= 4.5 else '✅'}
-
-<b>시장 심리</b>
-🪙 Crypto F&G: {crypto_fg.get('value', 'N/A')} ({crypto_fg.get('label', 'N/A')})
-📈 Stock F&G: {stock_fg.get('value', 'N/A')} ({stock_fg.get('label', 'N/A')})
-
-━━━━━━━━━━━━━━━━━━━━
-업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-
-        return message
-    except Exception as e:
-        print(f"Error generating weekly summary: {e}")
-        return "Error generating summary"
-
-
-def main():
-    """Main monitoring logic"""
+def main(fg_ttl: int = FG_CACHE_TTL):
+    """Main monitoring logic (fg_ttl: cache TTL for the Fear & Greed / aggregate responses)"""
     print(f"Starting monitoring at {datetime.now()}")
 
     # Load previous state
     prev_state = load_state()
 
     # Fetch current data
-    data = fetch_dashboard_data()
+    data = fetch_dashboard_data(fg_ttl)
     if not data:
         print("Failed to fetch data")
         return
 
+    fg_data = data['fearGreed']
+    current_indicators = carry_forward_indicators(get_latest_indicators(data['fred']),
+                                                  prev_state.get('indicators', {}))
+
     # Get current Fear & Greed labels from API (original source)
-    crypto_fg = data['fearGreed'].get('crypto', {})
-    stock_fg = data['fearGreed'].get('stock', {})
+    crypto_fg = fg_data.get('crypto', {})
+    stock_fg = fg_data.get('stock', {})
 
     current_crypto_label = crypto_fg.get('label') if crypto_fg else None
     current_stock_label = stock_fg.get('label') if stock_fg else None
@@ -318,37 +556,51 @@ def main():
     print(f"Crypto F&G: {crypto_fg.get('value')} ({current_crypto_label})")
     print(f"Stock F&G: {stock_fg.get('value')} ({current_stock_label})")
 
+    # Skip alert evaluation when nothing the checks depend on has changed
+    input_hash = compute_input_hash(current_indicators, current_crypto_label, current_stock_label)
+    if input_hash == prev_state.get('input_hash'):
+        save_state({**prev_state, 'last_checked_at': data['timestamp']})
+        print("No change since last run. Alerts sent: 0")
+        return
+
+    # Composite score and regime, computed once and persisted for the next run / daemon
+    risk_score = calculate_risk_score(current_indicators)
+    regime = get_regime_from_score(risk_score)
+    print(f"Risk Score: {risk_score:.3f} ({REGIME_THRESHOLDS[regime]['label']})")
+
     # Prepare current state
     current_state = {
         'crypto_fg_label': current_crypto_label,
         'stock_fg_label': current_stock_label,
-        'indicators': {
-            't10y2y': data['fred']['t10y2y'][-1]['value'],
-            'hyOas': data['fred']['hyOas'][-1]['value'],
-            'ismPmi': data['fred']['ismPmi'][-1]['value'],
-            'unrate': data['fred']['unrate'][-1]['value']
-        },
-        'timestamp': data['timestamp']
+        'indicators': current_indicators,
+        'score': risk_score,
+        'regime': regime,
+        'input_hash': input_hash,
+        'timestamp': data['timestamp'],
+        'last_checked_at': data['timestamp']
     }
 
     # Check alerts
     alerts = []
 
     # Tier 1: Fear & Greed regime changes
-    regime_alert = check_regime_changes(data['fearGreed'], prev_state)
+    regime_alert = check_regime_changes(fg_data, prev_state)
     if regime_alert:
         alerts.append(regime_alert)
 
     # Tier 2: Indicator thresholds
-    tier2_alerts = check_tier2_alerts(data['fred'], prev_state)
+    tier2_alerts = check_tier2_alerts(current_indicators, prev_state)
     alerts.extend(tier2_alerts)
 
-    # Send alerts
-    for alert in alerts:
-        send_telegram_message(alert)
+    # Send alerts (batched into one message per tick when they fit) while saving state
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(send_telegram_message, message) for message in batch_alerts(alerts)]
+
+        # Save current state
+        save_state(current_state)
 
-    # Save current state
-    save_state(current_state)
+        for future in futures:
+            future.result()
 
     print(f"Monitoring complete. Alerts sent: {len(alerts)}")
 
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Macro Risk Dashboard - Monitoring Daemon
+Runs monitor.main() in a single long-lived process with adaptive polling:
+every 5 minutes while the risk score sits near a regime boundary, hourly otherwise.
+The HTTP session, response cache and parsed state stay warm across ticks.
+"""
+
+import time
+from typing import Optional
+
+from monitor import FG_CACHE_TTL, REGIME_BOUNDS, main, load_state, calculate_risk_score
+
+# Polling intervals (seconds) and how close to a regime bound counts as "near"
+FAST_INTERVAL = 5 * 60
+SLOW_INTERVAL = 60 * 60
+BOUNDARY_MARGIN = 0.03
+
+# Dashboard responses must not outlive the fast interval, otherwise near-boundary
+# ticks would only re-read the disk cache; expired entries revalidate via ETag
+DAEMON_FG_CACHE_TTL = min(FG_CACHE_TTL, FAST_INTERVAL)
+
+
+def near_boundary(score: Optional[float]) -> bool:
+    """True when the score is within BOUNDARY_MARGIN of any regime bound"""
+    if score is None:
+        return False
+    return min(abs(score - bound) for bound in REGIME_BOUNDS) < BOUNDARY_MARGIN
+
+
+def next_interval() -> int:
+    """Pick the sleep interval from the risk score of the last saved state"""
+    state = load_state()
+    score = state.get('score')
+    if 'score' not in state and state.get('indicators'):
+        # state.json written before the score was persisted
+        score = calculate_risk_score(state['indicators'])
+    return FAST_INTERVAL if near_boundary(score) else SLOW_INTERVAL
+
+
+def run():
+    """Run monitoring ticks forever (Ctrl+C to stop)"""
+    while True:
+        try:
+            main(fg_ttl=DAEMON_FG_CACHE_TTL)
+        except Exception as e:
+            print(f"Monitoring tick failed: {e}")
+
+        try:
+            interval = next_interval()
+        except Exception as e:
+            print(f"Could not read state for polling interval: {e}")
+            interval = SLOW_INTERVAL
+        print(f"Next check in {interval // 60} minutes")
+        time.sleep(interval)
+
+
+if __name__ == '__main__':
+    try:
+        run()
+    except KeyboardInterrupt:
+        print("Monitoring daemon stopped")
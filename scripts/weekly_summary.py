@@ -16,42 +16,46 @@ from monitor import (
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID,
     REGIME_THRESHOLDS,
+    REGIME_ACTIONS,
+    INDICATOR_THRESHOLDS,
     fetch_dashboard_data,
+    get_latest_indicators,
     calculate_risk_score,
     get_regime_from_score,
+    indicator_breached,
     send_telegram_message
 )
 
+# Indicator status emoji indexed by "threshold breached" (False -> ✅, True -> ⚠️)
+STATUS_EMOJI = ('✅', '⚠️')
 
-def generate_weekly_summary(data: dict) -> str:
-    """Generate comprehensive weekly summary"""
-    try:
-        fred_data = data['fred']
-        fg_data = data['fearGreed']
 
-        # Calculate risk score
-        risk_score = calculate_risk_score(fred_data)
-        if risk_score is None:
-            return "⚠️ 데이터 계산 오류"
+def format_value(value, spec: str, unit: str = '') -> str:
+    """Format an indicator value, 'N/A' when the latest reading is missing"""
+    return 'N/A' if value is None else f"{value:{spec}}{unit}"
 
+
+def generate_weekly_summary(indicators: dict, fg_data: dict) -> str:
+    """Generate comprehensive weekly summary"""
+    try:
+        # Calculate risk score (missing indicators contribute 0)
+        risk_score = calculate_risk_score(indicators)
         regime = get_regime_from_score(risk_score)
         regime_info = REGIME_THRESHOLDS[regime]
 
         # Get indicator values
-        t10y2y = fred_data['t10y2y'][-1]['value']
-        hyOas = fred_data['hyOas'][-1]['value']
-        ismPmi = fred_data['ismPmi'][-1]['value']
-        unrate = fred_data['unrate'][-1]['value']
+        t10y2y = indicators['t10y2y']
+        hyOas = indicators['hyOas']
+        ismPmi = indicators['ismPmi']
+        unrate = indicators['unrate']
 
         # Get Fear & Greed values
         crypto_fg = fg_data.get('crypto', {})
         stock_fg = fg_data.get('stock', {})
 
-        # Determine status emojis
-        t10y2y_status = '⚠️' if (t10y2y and t10y2y <= 0) else '✅'
-        hyoas_status = '⚠️' if (hyOas and hyOas >= 6.0) else '✅'
-        ismpmi_status = '⚠️' if (ismPmi and ismPmi < 50) else '✅'
-        unrate_status = '⚠️' if (unrate and unrate >= 4.5) else '✅'
+        # Determine status emojis (same breach predicates as the Tier 2 alerts)
+        status = {key: STATUS_EMOJI[indicator_breached(key, indicators[key])]
+                  for key in INDICATOR_THRESHOLDS}
 
         # Build message
         message = f"""📊 <b>주간 Macro Risk 리뷰</b>
@@ -62,10 +66,10 @@ def generate_weekly_summary(data: dict) -> str:
 Risk Score: <b>{risk_score:.3f}</b>
 
 <b>📈 거시 지표</b>
-{t10y2y_status} T10Y2Y: {t10y2y:.2f}%{' (역전!)' if t10y2y <= 0 else ''}
-{hyoas_status} HY OAS: {hyOas:.2f}%
-{ismpmi_status} ISM PMI: {ismPmi:.1f}
-{unrate_status} 실업률: {unrate:.1f}%
+{status['t10y2y']} T10Y2Y: {format_value(t10y2y, '.2f', '%')}{' (역전!)' if indicator_breached('t10y2y', t10y2y) else ''}
+{status['hyOas']} HY OAS: {format_value(hyOas, '.2f', '%')}
+{status['ismPmi']} ISM PMI: {format_value(ismPmi, '.1f')}
+{status['unrate']} 실업률: {format_value(unrate, '.1f', '%')}
 
 <b>💹 시장 심리</b>
 🪙 Crypto F&G: {crypto_fg.get('value', 'N/A')} ({crypto_fg.get('label', 'N/A')})
@@ -76,31 +80,7 @@ Risk Score: <b>{risk_score:.3f}</b>
 """
 
         # Add action recommendations
-        actions = {
-            'riskOn': [
-                '✅ 정상 투자 전략 유지',
-                '✅ DCA 지속 가능',
-                '✅ 성장주 비중 유지'
-            ],
-            'neutral': [
-                '⚠️ DCA 중단 고려',
-                '⚠️ 현금 비중 점검',
-                '⚠️ 방어주 편입 검토'
-            ],
-            'riskOff': [
-                '🔴 현금 비중 30% 이상 상향',
-                '🔴 방어 자산 20% 편입 고려',
-                '🔴 레버리지 포지션 축소'
-            ],
-            'crisis': [
-                '🚨 풀헤지 진입 검토',
-                '🚨 현금 비중 50% 이상',
-                '🚨 신규 진입 중단'
-            ]
-        }
-
-        for action in actions[regime]:
-            message += f"\n{action}"
+        message += '\n' + REGIME_ACTIONS[regime]
 
         message += f"""
 
@@ -124,8 +104,14 @@ def main():
         print("Failed to fetch data")
         return
 
+    try:
+        indicators = get_latest_indicators(data['fred'])
+    except (KeyError, IndexError, TypeError) as e:
+        print(f"Unexpected FRED payload: {e}")
+        return
+
     # Generate summary
-    summary = generate_weekly_summary(data)
+    summary = generate_weekly_summary(indicators, data['fearGreed'])
 
     # Send to Telegram
     send_telegram_message(summary)